@@ -6,6 +6,7 @@ see `this
 <https://nipy.org/nibabel/dicom/siemens_csa.html#siemens-format-dicom-with-csa-header>`_
 `NiBabel <https://nipy.org/nibabel/index.html>`_ article.
 """
+from csa_header.batch import read_many
 from csa_header.header import CsaHeader
 
-__all__ = ["CsaHeader"]
+__all__ = ["CsaHeader", "read_many"]
@@ -36,10 +36,17 @@ The last problem for assignment is that lines like ``sWipMemBlock.alFree[0]	 =
 ``sWipMemBlock.alFree.__attribute__.size = 64``, implying object assignment.
 
 We deal with this by dropping any assignments containing ``__attribute__``.
+
+Parsing the whole text with the AST parser is relatively slow, and nearly all
+ASCCONV lines are simple assignments of a number or a string to a dotted and
+subscripted name. Such lines are therefore first matched with precompiled
+regular expressions, falling back to the AST parser for the whole text if any
+line is not of this simple form (or its assignment fails).
 """
 from __future__ import annotations
 
 import ast
+import keyword
 import re
 from collections.abc import Sequence
 from typing import Callable, cast
@@ -58,6 +65,41 @@ TERMINAL_DIGIT_PATTERN = r"^(.*)\.(\d+)(\s+=)"
 #: Regular expression to replace terminal integer identifiers.
 TERMINAL_DIGIT_RE = re.compile(TERMINAL_DIGIT_PATTERN, re.M)
 
+#: Simple (normalized) assignment line regular expression pattern. Matches a
+#: dotted and subscripted name, assigned a single string, integer, hexadecimal
+#: integer, or float literal (optionally negated), followed by an optional
+#: comment.
+SIMPLE_ASSIGNMENT_PATTERN = (
+    r"(?P<target>[A-Za-z_]\w*(?:\.[A-Za-z_]\w*|\[(?:0|[1-9]\d*)\])*)[ \t]*=[ \t]*"
+    r"(?:"
+    r'"""(?P<string>(?:[^"\\\x00-\x08\x0a-\x1f]|\\\\)*)"""'
+    r"|(?P<negative>-[ \t]*)?"
+    r"(?:"
+    r"(?P<hex>0[xX][0-9a-fA-F]+)"
+    r"|(?P<float>\d+\.\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+)"
+    r"|(?P<int>0|[1-9]\d*)"
+    r")"
+    r")"
+    r"[ \t]*(?:#[^\x00-\x08\x0a-\x1f]*)?"
+)
+
+#: Regular expression to match simple (normalized) assignment lines.
+SIMPLE_ASSIGNMENT_RE = re.compile(SIMPLE_ASSIGNMENT_PATTERN, re.ASCII)
+
+#: Regular expression to match lines ignored by the Python parser.
+BLANK_LINE_RE = re.compile(r"[ \t]*(?:#[^\x00-\x08\x0a-\x1f]*)?")
+
+#: Regular expression to split a simple assignment target into atoms.
+TARGET_ATOM_RE = re.compile(r"([A-Za-z_]\w*)|\[(\d+)\]", re.ASCII)
+
+#: Names that may not be assigned to in Python.
+RESERVED_NAMES = frozenset(keyword.kwlist) | {"__debug__"}
+
+#: Types of valid assignment values. Value nodes are checked against
+#: :class:`ast.Constant` directly, rather than the deprecated :class:`ast.Num`
+#: and :class:`ast.Str` aliases, whose instance checks run in Python.
+VALUE_TYPES = (int, float, complex, str)
+
 
 class AscconvParseError(Exception):
     """
@@ -107,7 +149,7 @@ def assign_to_atoms(assign_ast, default_class=int) -> Sequence[tuple]:
             prev_target_type = dict
         elif isinstance(target, ast.Subscript):
             if isinstance(target.slice, ast.Constant):  # PY39
-                index = target.slice.n
+                index = target.slice.value
             else:  # PY38
                 index = target.slice.value.n
             atoms.append((target, prev_target_type, index))
@@ -201,16 +243,105 @@ def obj_from_atoms(atoms, namespace):
 
 def _get_value(assign):
     value = assign.value
-    if isinstance(value, ast.Num):
-        return value.n
-    if isinstance(value, ast.Str):
-        return value.s
-    if isinstance(value, ast.UnaryOp) and isinstance(value.op, ast.USub):
-        return -value.operand.n
+    if isinstance(value, ast.Constant):
+        # Exact type check, as booleans and None are not valid values.
+        if type(value.value) in VALUE_TYPES:
+            return value.value
+    elif isinstance(value, ast.UnaryOp) and isinstance(value.op, ast.USub):
+        return -value.operand.value
     message = messages.UNEXPECTED_RHS.format(value=value)
     raise AscconvParseError(message)
 
 
+def _parse_simple_value(match: re.Match):
+    """
+    Returns the value of a matched simple assignment line.
+    """
+    string, hexadecimal, real, integer = match.group("string", "hex", "float", "int")
+    if string is not None:
+        return string.replace("\\\\", "\\")
+    value: int | float
+    if hexadecimal is not None:
+        value = int(hexadecimal, 16)
+    elif real is not None:
+        value = float(real)
+    else:
+        value = int(integer)
+    return -value if match.group("negative") else value
+
+
+def _assign_simple(target: str, value, namespace: dict) -> bool:
+    """
+    Assigns `value` to a simple assignment `target` in `namespace`, following
+    the same rules as :func:`obj_from_atoms`.
+
+    Returns
+    -------
+    bool
+        Whether the assignment was valid
+    """
+    atoms = TARGET_ATOM_RE.findall(target)
+    names = {name for name, _ in atoms}
+    if not names.isdisjoint(RESERVED_NAMES):
+        return False
+    # Discard __attribute__ lines.
+    if "__attribute__" in names:
+        return True
+    root_obj = namespace
+    i_last = len(atoms) - 1
+    for i_atom, (name, index) in enumerate(atoms):
+        prev_root = root_obj
+        maker: type
+        if i_atom == i_last:
+            maker = int  # Placeholder for any scalar value
+        else:
+            maker = list if atoms[i_atom + 1][1] else dict
+        if index:
+            key = int(index)
+            root_obj = _create_subscript_in(maker, key, root_obj)
+        else:
+            key = name
+            root_obj = _create_obj_in(maker, key, root_obj)
+        if not isinstance(root_obj, maker):
+            return False
+    prev_root[key] = value
+    return True
+
+
+def _parse_simple_ascconv_text(content: str) -> dict | None:
+    """
+    Parses normalized ASCCONV text consisting of simple assignments only.
+
+    Parameters
+    ----------
+    content : str
+        Normalized ASCCONV text
+
+    Returns
+    -------
+    dict | None
+        Meta data pulled from the ASCCONV section, or None if any line is not
+        a simple assignment or could not be assigned
+    """
+    prot_dict: dict = {}
+    match_assignment = SIMPLE_ASSIGNMENT_RE.fullmatch
+    match_blank = BLANK_LINE_RE.fullmatch
+    for line in content.split("\n"):
+        match = match_assignment(line)
+        if match is None:
+            if match_blank(line) is None:
+                return None
+            continue
+        try:
+            value = _parse_simple_value(match)
+        except ValueError:
+            # E.g. integers exceeding the maximal number of digits.
+            return None
+        if not _assign_simple(match.group("target"), value, prot_dict):
+            return None
+    return prot_dict
+
+
 def parse_ascconv_text(content: str, delimiter: str = '"') -> dict:
     """
     Parse ASCCONV text format from `content` string.
@@ -236,6 +367,9 @@ def parse_ascconv_text(content: str, delimiter: str = '"') -> dict:
     content = content.replace(delimiter, '"""').replace("\\", "\\\\")
     # Invalid digit identifiers to list
     content = TERMINAL_DIGIT_RE.sub(r"\1[\2]\3", content)
+    prot_dict = _parse_simple_ascconv_text(content)
+    if prot_dict is not None:
+        return prot_dict
     # Use Python's own parser to parse modified ASCCONV assignments
     tree = ast.parse(content)
 
@@ -1,33 +1,47 @@
 """
 Definition of the :class:`CsaAsciiHeader`.
 """
-from typing import Union
+from collections.abc import Iterator, Mapping
+from typing import Any, Union
 
 from csa_header.ascii.ascconv import parse_ascconv
+from csa_header.utils import ParseCache
 
+#: Maximal number of parsed ASCCONV headers kept in cache.
+PARSE_CACHE_SIZE: int = 32
 
-class CsaAsciiHeader:
+#: Parsed ASCCONV headers, shared across :class:`CsaAsciiHeader` instances.
+#: Protocols tend to repeat across the series of a study, and parsing them is
+#: by far the most expensive part of reading a CSA header.
+_PARSE_CACHE = ParseCache(PARSE_CACHE_SIZE)
+
+
+class CsaAsciiHeader(Mapping):
     """
     Represents and handles the parsing of
     `CSA header <https://nipy.org/nibabel/dicom/siemens_csa.html>`_ values
     returned by `pydicom <https://github.com/pydicom/pydicom>`_ as bytes.
+
+    Instances are read-only mappings of the parsed header information, which
+    is only parsed once it is first accessed.
     """
 
     #: The header's ASCII-based character encoding.
     ENCODING = "ISO-8859-1"
 
+    #: Cache key digest personalization for headers given as strings.
+    TEXT_KEY_PERSON = b"text"
+
     def __init__(self, header: Union[str, bytes]):
         """
-        Decodes the header and sets empty property caches to be overriden on
-        request.
+        Sets empty property caches to be overriden on request.
 
         Parameters
         ----------
         header : Union[str, bytes]
-            String or bytes containing ASCCONV header information.
+            String or bytes containing ASCCONV header information. Bytes are
+            only decoded once the header is actually parsed.
         """
-        if isinstance(header, bytes):
-            header = header.decode(self.ENCODING)
         self._header = header
 
         # Property cache
@@ -49,8 +63,37 @@ class CsaAsciiHeader:
         -------
         dict
             Header information as a dictionary
+
+        Notes
+        -----
+        Results are cached by the header's contents, so parsing an identical
+        header again returns a copy of the cached result.
         """
-        return parse_ascconv(self._header, '""')[0]
+        header = self._header
+        if isinstance(header, str):
+            # Strings may contain characters the header's encoding cannot
+            # represent, so they are keyed by a lossless encoding instead.
+            key = _PARSE_CACHE.get_key(header.encode("utf-8", "surrogatepass"), person=self.TEXT_KEY_PERSON)
+        else:
+            key = _PARSE_CACHE.get_key(header)
+        parsed = _PARSE_CACHE.get(key)
+        if parsed is None:
+            text = header if isinstance(header, str) else header.decode(self.ENCODING)
+            parsed = parse_ascconv(text, '""')[0]
+            _PARSE_CACHE.put(key, parsed)
+        return parsed
+
+    def __getitem__(self, key: str) -> Any:
+        return self.parsed[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.parsed)
+
+    def __len__(self) -> int:
+        return len(self.parsed)
+
+    def __repr__(self) -> str:
+        return repr(self.parsed)
 
     @property
     def parsed(self) -> dict:
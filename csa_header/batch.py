@@ -0,0 +1,77 @@
+"""
+Utilities for reading many CSA headers at once, e.g. all the headers of a
+study.
+"""
+import os
+import sys
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from csa_header.header import CsaHeader
+
+
+def _read(raw: bytes) -> dict:
+    """
+    Reads a single CSA header.
+
+    Parameters
+    ----------
+    raw : bytes
+        Raw CSA header
+
+    Returns
+    -------
+    dict
+        Parsed CSA header information
+    """
+    return CsaHeader(raw).read()
+
+
+def _gil_enabled() -> bool:
+    """
+    Returns whether the running interpreter has its GIL enabled, i.e. whether
+    threads may not parse headers in parallel.
+
+    Returns
+    -------
+    bool
+        GIL enabled or not
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
+def read_many(raws: Sequence[bytes], max_workers: Optional[int] = None) -> list[dict]:
+    """
+    Reads multiple CSA headers in parallel.
+
+    Headers are read in worker processes, or in threads if the interpreter is
+    a free-threaded build with the GIL disabled.
+
+    Parameters
+    ----------
+    raws : Sequence[bytes]
+        Raw CSA headers
+    max_workers : int, optional
+        Maximal number of workers, by default None (number of CPUs)
+
+    Returns
+    -------
+    list[dict]
+        Parsed CSA header information, in the same order as *raws*
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(raws)))
+    if max_workers == 1:
+        return [_read(raw) for raw in raws]
+    executor: Executor
+    if _gil_enabled():
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+        chunksize = max(1, len(raws) // (max_workers * 4))
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        chunksize = 1
+    with executor:
+        return list(executor.map(_read, raws, chunksize=chunksize))
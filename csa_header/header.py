@@ -1,12 +1,19 @@
 """Definition of the :class:`CsaHeader` class."""
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Callable, Iterable
+from struct import Struct, unpack_from
+from typing import Any, ClassVar, Optional, Union
 
 from csa_header.ascii import CsaAsciiHeader
 from csa_header.exceptions import CsaReadError
-from csa_header.messages import INVALID_CHECK_BIT, READ_OVERREACH
-from csa_header.unpacker import Unpacker
-from csa_header.utils import VR_TO_TYPE, strip_to_null
+from csa_header.messages import INVALID_CHECK_BIT, READ_OVERREACH, TOO_MANY_ITEMS
+from csa_header.utils import ENCODING, NULL, VR_TO_TYPE, ParseCache, decode_vr
+
+#: Maximal number of parsed CSA headers kept in cache.
+READ_CACHE_SIZE: int = 32
+
+#: Parsed CSA headers, shared across :class:`CsaHeader` instances created with
+#: *enable_cache*.
+_READ_CACHE = ParseCache(READ_CACHE_SIZE)
 
 
 class CsaHeader:
@@ -23,46 +30,88 @@ class CsaHeader:
        https://github.com/icometrix/dicom2nifti/blob/6722420a7673d36437e4358ce3cb2a7c77c91820/dicom2nifti/convert_siemens.py#L342
     """
 
-    CSA_TYPE_1: int = 1
-    CSA_TYPE_2: int = 2
+    CSA_TYPE_1: ClassVar[int] = 1
+    CSA_TYPE_2: ClassVar[int] = 2
 
     #: Used to determine whether the CSA header is of type 1 or 2.
-    TYPE_2_IDENTIFIER: bytes = b"SV10"
+    TYPE_2_IDENTIFIER: ClassVar[bytes] = b"SV10"
 
     #: Endian format used to parse the CSA header information (little-endian).
-    ENDIAN: str = "<"
+    ENDIAN: ClassVar[str] = "<"
 
     #: Format string used to unpack a single tag.
-    TAG_FORMAT_STRING: str = "64si4s3i"
+    TAG_FORMAT_STRING: ClassVar[str] = "64si4s3i"
 
     #: Number of tags unpacking format characters (2 unsigned integers).
-    PREFIX_FORMAT: str = "2I"
+    PREFIX_FORMAT: ClassVar[str] = "2I"
 
     #: Item value unpacking format characters (4 integers).
-    ITEM_FORMAT: str = "4i"
+    ITEM_FORMAT: ClassVar[str] = "4i"
+
+    #: Item length unpacking format characters (CSA type 2). Skips all but the
+    #: second integer of the item header, so that a run of item headers may be
+    #: unpacked in a single call.
+    ITEM_LENGTH_FORMAT: ClassVar[str] = "4xi8x"
+
+    #: Item length unpacking format characters (CSA type 1). Skips all but the
+    #: first integer of the item header.
+    TYPE_1_ITEM_LENGTH_FORMAT: ClassVar[str] = "i12x"
+
+    #: Precompiled structs for the fixed formats above.
+    _TAG_STRUCT: ClassVar[Struct] = Struct(ENDIAN + TAG_FORMAT_STRING)
+    _PREFIX_STRUCT: ClassVar[Struct] = Struct(ENDIAN + PREFIX_FORMAT)
+    _ITEM_STRUCT: ClassVar[Struct] = Struct(ENDIAN + ITEM_FORMAT)
+    _ITEM_LENGTH_STRUCT: ClassVar[Struct] = Struct(ENDIAN + ITEM_LENGTH_FORMAT)
+    _TYPE_1_ITEM_LENGTH_STRUCT: ClassVar[Struct] = Struct(ENDIAN + TYPE_1_ITEM_LENGTH_FORMAT)
 
     #: Valid values for the CSA element's check bit.
-    VALID_CHECK_BIT_VALUES: Iterable[int] = {77, 205}
+    VALID_CHECK_BIT_VALUES: ClassVar[Iterable[int]] = {77, 205}
+
+    #: ASCII header tag names. Their values are parsed as ASCCONV protocols,
+    #: or returned as :class:`~csa_header.ascii.header.CsaAsciiHeader`
+    #: instances, which are only parsed once accessed, if *lazy_ascii* is set.
+    ASCII_HEADER_TAGS: ClassVar[Iterable[str]] = {"MrPhoenixProtocol"}
 
-    #: ASCII header tag names.
-    ASCII_HEADER_TAGS: Iterable[str] = {"MrPhoenixProtocol"}
+    #: Read cache key digest personalization for *lazy_ascii* results.
+    LAZY_ASCII_KEY_PERSON: ClassVar[bytes] = b"lazy_ascii"
 
-    #: CSA type 1 length fix.
-    _first_tag_n_items: int = None
+    __slots__ = ("raw", "enable_cache", "lazy_ascii", "header_size", "_csa_type", "_is_type_2", "_first_tag_n_items")
 
-    def __init__(self, raw: bytes):
+    def __init__(
+        self, raw: Union[bytes, bytearray, memoryview], *, enable_cache: bool = False, lazy_ascii: bool = False
+    ):
         """
         Initialize a new `CsaHeader` instance.
 
         Parameters
         ----------
-        raw : bytes
-            Raw CSA header as read by *pydicom*
+        raw : Union[bytes, bytearray, memoryview]
+            Raw CSA header as read by *pydicom*. Bytes and bytearrays are used
+            as is, other buffers are copied to bytes once
+        enable_cache : bool, optional
+            Whether to cache :meth:`read` results by the raw header's
+            contents, by default False. Useful when reading many identical
+            headers, e.g. the CSA series headers of a single series
+        lazy_ascii : bool, optional
+            Whether to return ASCII header tag values as read-only
+            :class:`~csa_header.ascii.header.CsaAsciiHeader` mappings, which
+            are only parsed once accessed, rather than as dictionaries, by
+            default False
         """
+        if not isinstance(raw, (bytes, bytearray)):
+            # Parsing relies on bytes methods (e.g. partition), which other
+            # buffers such as memoryviews do not provide.
+            raw = bytes(raw)
         self.raw = raw
+        self.enable_cache = enable_cache
+        self.lazy_ascii = lazy_ascii
         self.header_size = len(self.raw)
+        self._csa_type = self.check_csa_type()
+        self._is_type_2 = self._csa_type == self.CSA_TYPE_2
+        # CSA type 1 length fix.
+        self._first_tag_n_items: Optional[int] = None
 
-    def skip_prefix(self, unpacker: Unpacker):
+    def skip_prefix(self, pointer: int = 0) -> int:
         """
         Skip the CSA type 2 header prefix.
 
@@ -72,13 +121,18 @@ class CsaHeader:
 
         Parameters
         ----------
-        unpacker : Unpacker
-            Stream-like header reader
+        pointer : int, optional
+            Current position in the raw header, by default 0
+
+        Returns
+        -------
+        int
+            Position following the prefix
         """
-        if self.is_type_2:
-            prefix_length = len(self.TYPE_2_IDENTIFIER)
-            unpacker.pointer = prefix_length
-            unpacker.read(prefix_length)
+        if self._is_type_2:
+            # The identifier is followed by 4 unused bytes.
+            return 2 * len(self.TYPE_2_IDENTIFIER)
+        return pointer
 
     def validate_check_bit(self, i_tag: int, value: int):
         """
@@ -108,14 +162,53 @@ class CsaHeader:
             )
             raise CsaReadError(message)
 
-    def parse_items(self, unpacker: Unpacker, n_items: int, vr: str, vm: int) -> Any:
+    def skip_empty_items(self, pointer: int, n_items: int) -> int:
+        """
+        Skips a run of surplus CSA type 2 item headers. Items beyond the
+        element's value multiplicity are expected to be empty, and since empty
+        items have no value bytes, their headers are contiguous and may be
+        unpacked all at once.
+
+        Parameters
+        ----------
+        pointer : int
+            Position of the first surplus item header in the raw header
+        n_items : int
+            Number of surplus items
+
+        Returns
+        -------
+        int
+            Position following the surplus items
+
+        Raises
+        ------
+        CsaReadError
+            Non-empty surplus item
+        """
+        item_size = self._ITEM_STRUCT.size
+        destination = pointer + n_items * item_size
+        if destination > self.header_size:
+            message = READ_OVERREACH.format(destination=destination, max_length=self.header_size)
+            raise CsaReadError(message)
+        item_lengths = unpack_from(self.ENDIAN + self.ITEM_LENGTH_FORMAT * n_items, self.raw, pointer)
+        if not any(item_lengths):
+            return destination
+        i_item = next(i for i, item_len in enumerate(item_lengths) if item_len)
+        destination = pointer + (i_item + 1) * item_size + item_lengths[i_item]
+        if destination > self.header_size:
+            message = READ_OVERREACH.format(destination=destination, max_length=self.header_size)
+            raise CsaReadError(message)
+        raise CsaReadError(TOO_MANY_ITEMS)
+
+    def parse_items(self, pointer: int, n_items: int, vr: str, vm: int, *, decode: bool = True) -> tuple[Any, int]:
         """
         Parses a single header element's value.
 
         Parameters
         ----------
-        unpacker : Unpacker
-            Stream-like header reader
+        pointer : int
+            Position of the element's first item in the raw header
         n_items : int
             Number of items in this element's value as described in the header
             information
@@ -123,45 +216,196 @@ class CsaHeader:
             Value representation
         vm : int
             Value multiplicity
+        decode : bool, optional
+            Whether to decode item values, by default True. Otherwise, the
+            items' null-stripped bytes are returned
 
         Returns
         -------
-        Any
-            CSA header element value
+        tuple[Any, int]
+            CSA header element value and the position following its items
 
         Raises
         ------
         CsaReadError
             Invalid element value
         """
-        n_values = vm or n_items
         converter = VR_TO_TYPE.get(vr)
-        items = []
+        if self._is_type_2:
+            return self.parse_type_2_items(pointer, n_items, vm, converter, decode=decode)
+        return self.parse_type_1_items(pointer, n_items, vm, converter, decode=decode)
+
+    def parse_type_2_items(
+        self,
+        pointer: int,
+        n_items: int,
+        vm: int,
+        converter: Optional[Callable[[str], Any]],
+        *,
+        decode: bool = True,
+    ) -> tuple[Any, int]:
+        """
+        Parses a single CSA type 2 header element's value.
+
+        See Also
+        --------
+        * :meth:`parse_items`
+
+        Parameters
+        ----------
+        pointer : int
+            Position of the element's first item in the raw header
+        n_items : int
+            Number of items in this element's value as described in the header
+            information
+        vm : int
+            Value multiplicity
+        converter : Callable[[str], Any], optional
+            Item value type converter
+        decode : bool, optional
+            Whether to decode item values, by default True
+
+        Returns
+        -------
+        tuple[Any, int]
+            CSA header element value and the position following its items
+
+        Raises
+        ------
+        CsaReadError
+            Invalid element value
+        """
+        n_values = vm or n_items
+        # Bind loop invariants locally to avoid repeated attribute lookups.
+        raw = self.raw
+        header_size = self.header_size
+        unpack_item_length = self._ITEM_LENGTH_STRUCT.unpack_from
+        item_size = self._ITEM_STRUCT.size
+        # Fast path for the common single-valued element.
+        if n_values == 1 and n_items > 0:
+            (item_len,) = unpack_item_length(raw, pointer)
+            pointer += item_size
+            destination = pointer + item_len
+            if destination > header_size:
+                message = READ_OVERREACH.format(destination=destination, max_length=header_size)
+                raise CsaReadError(message)
+            # Item values are stripped and decoded inline (see strip_to_null).
+            value: Any = raw[pointer:destination].partition(NULL)[0]
+            if decode:
+                value = value.decode(ENCODING)
+            pointer = destination + (-item_len & 3)
+            if converter:
+                value = converter(value) if item_len else None
+            if n_items > 1:
+                pointer = self.skip_empty_items(pointer, n_items - 1)
+            return value, pointer
+        items: list[Any] = []
         for i_item in range(n_items):
-            x0, x1, _, _ = unpacker.unpack(self.ITEM_FORMAT)
+            if i_item >= n_values:
+                pointer = self.skip_empty_items(pointer, n_items - i_item)
+                break
+            (item_len,) = unpack_item_length(raw, pointer)
+            pointer += item_size
+            destination = pointer + item_len
+            if destination > header_size:
+                message = READ_OVERREACH.format(destination=destination, max_length=header_size)
+                raise CsaReadError(message)
+            item: Any = raw[pointer:destination].partition(NULL)[0]
+            if decode:
+                item = item.decode(ENCODING)
+            pointer = destination
+            if converter:
+                # We may have fewer real items than are given in
+                # n_items, but we don't know how many - assume that
+                # we've reached the end when we hit an empty item
+                if item_len == 0:
+                    n_values = i_item
+                    continue
+                item = converter(item)
+            items.append(item)
+            # go to 4 byte boundary
+            pointer += -item_len & 3
+        if items:
+            return (items if len(items) > 1 else items[0]), pointer
+        return None, pointer
+
+    def parse_type_1_items(
+        self,
+        pointer: int,
+        n_items: int,
+        vm: int,
+        converter: Optional[Callable[[str], Any]],
+        *,
+        decode: bool = True,
+    ) -> tuple[Any, int]:
+        """
+        Parses a single CSA type 1 header element's value.
+
+        See Also
+        --------
+        * :meth:`parse_items`
+
+        Parameters
+        ----------
+        pointer : int
+            Position of the element's first item in the raw header
+        n_items : int
+            Number of items in this element's value as described in the header
+            information
+        vm : int
+            Value multiplicity
+        converter : Callable[[str], Any], optional
+            Item value type converter
+        decode : bool, optional
+            Whether to decode item values, by default True
+
+        Returns
+        -------
+        tuple[Any, int]
+            CSA header element value and the position following its items
+
+        Raises
+        ------
+        CsaReadError
+            Invalid element value
+        """
+        n_values = vm or n_items
+        # Bind loop invariants locally to avoid repeated attribute lookups.
+        raw = self.raw
+        header_size = self.header_size
+        first_tag_n_items = self._first_tag_n_items
+        unpack_item_length = self._TYPE_1_ITEM_LENGTH_STRUCT.unpack_from
+        item_size = self._ITEM_STRUCT.size
+        items: list[Any] = []
+        for i_item in range(n_items):
+            if i_item == n_values:
+                # Surplus items are expected to be empty, in which case their
+                # headers are contiguous and may be checked all at once.
+                # Otherwise, fall back to checking them one by one.
+                n_surplus = n_items - i_item
+                destination = pointer + n_surplus * item_size
+                if destination <= header_size:
+                    item_lengths = unpack_from(self.ENDIAN + self.TYPE_1_ITEM_LENGTH_FORMAT * n_surplus, raw, pointer)
+                    if item_lengths.count(first_tag_n_items) == n_surplus:
+                        pointer = destination
+                        break
+            (x0,) = unpack_item_length(raw, pointer)
+            pointer += item_size
             # CSA1 odd length calculation
-            if self.csa_type == 1:
-                item_len = x0 - self._first_tag_n_items
-                destination = unpacker.pointer + item_len
-                negative_length = item_len < 0
-                overreach = destination > self.header_size
-                if negative_length or overreach:
-                    if i_item < vm:
-                        items.append("")
-                    break
-            # CSA2
-            else:
-                item_len = x1
-                destination = unpacker.pointer + item_len
-                if destination > self.header_size:
-                    message = READ_OVERREACH.format(destination=destination, max_length=self.header_size)
-                    raise CsaReadError(message)
+            item_len = x0 - first_tag_n_items
+            destination = pointer + item_len
+            if item_len < 0 or destination > header_size:
+                if i_item < vm:
+                    items.append("" if decode else b"")
+                break
             if i_item >= n_values:
                 if item_len != 0:
-                    message = "Too many items in CSA header element"
-                    raise CsaReadError(message)
+                    raise CsaReadError(TOO_MANY_ITEMS)
                 continue
-            item = strip_to_null(unpacker.read(item_len))
+            item: Any = raw[pointer:destination].partition(NULL)[0]
+            if decode:
+                item = item.decode(ENCODING)
+            pointer = destination
             if converter:
                 # We may have fewer real items than are given in
                 # n_items, but we don't know how many - assume that
@@ -172,41 +416,85 @@ class CsaHeader:
                 item = converter(item)
             items.append(item)
             # go to 4 byte boundary
-            remainder = item_len % 4
-            if remainder != 0:
-                unpacker.pointer += 4 - remainder
+            pointer += -item_len & 3
         if items:
-            return items if len(items) > 1 else items.pop()
+            return (items if len(items) > 1 else items[0]), pointer
+        return None, pointer
+
+    def parse_tag(self, pointer: int, i_tag: int) -> tuple[str, dict, int]:
+        """
+        Parses a single CSA header tag.
 
-    def parse_tag(self, unpacker: Unpacker, i_tag: int) -> dict:
+        Parameters
+        ----------
+        pointer : int
+            Position of the tag in the raw header
+        i_tag : int
+            Index of the parsed tag
+
+        Returns
+        -------
+        tuple[str, dict, int]
+            Tag name, parsed tag, and the position following it
+        """
         # 4th element (SyngoDT) seems to be a numeric representation of the
         # datatype, which is already provided as the VR.
-        name, vm, vr, _, n_items, check_bit = unpacker.unpack(self.TAG_FORMAT_STRING)
-        self.validate_check_bit(i_tag, check_bit)
-        name = strip_to_null(name)
-        vr = strip_to_null(vr)
-        tag = {
-            "name": name,
-            "index": i_tag,
-            "VR": vr,
-            "VM": vm,
-        }
+        name, vm, vr, _, n_items, check_bit = self._TAG_STRUCT.unpack_from(self.raw, pointer)
+        pointer += self._TAG_STRUCT.size
+        # Only call into validation (and its error reporting) on failure.
+        if check_bit not in self.VALID_CHECK_BIT_VALUES:
+            self.validate_check_bit(i_tag, check_bit)
+        # Inlined strip_to_null().
+        name = name.partition(NULL)[0].decode(ENCODING)
+        vr = decode_vr(vr)
         # CSA1-specific length modifier
         if i_tag == 1:
             self._first_tag_n_items = n_items
-        tag["value"] = self.parse_items(unpacker, n_items, vr, vm)
-        if name in self.ASCII_HEADER_TAGS:
-            tag["value"] = CsaAsciiHeader(tag["value"]).parse()
-        return tag
+        # ASCII header values are handed over undecoded, so that they are only
+        # decoded if not found in the parse cache.
+        is_ascii_header = name in self.ASCII_HEADER_TAGS
+        value, pointer = self.parse_items(pointer, n_items, vr, vm, decode=not is_ascii_header)
+        if is_ascii_header:
+            value = CsaAsciiHeader(value)
+            if not self.lazy_ascii:
+                value = value.parse()
+        tag = {"index": i_tag, "VR": vr, "VM": vm, "value": value}
+        return name, tag, pointer
 
     def read(self) -> dict:
-        unpacker = Unpacker(self.raw, endian=self.ENDIAN)
-        self.skip_prefix(unpacker)
-        n_tags, _ = unpacker.unpack(self.PREFIX_FORMAT)
+        """
+        Parses the raw CSA header.
+
+        Returns
+        -------
+        dict
+            Parsed tags by name
+        """
+        if self.enable_cache:
+            # Lazy and eager results differ, so they are cached separately.
+            key = _READ_CACHE.get_key(self.raw, person=self.LAZY_ASCII_KEY_PERSON if self.lazy_ascii else b"")
+            result = _READ_CACHE.get(key)
+            if result is None:
+                result = self.parse()
+                _READ_CACHE.put(key, result)
+            return result
+        return self.parse()
+
+    def parse(self) -> dict:
+        """
+        Parses the raw CSA header, bypassing the cache.
+
+        Returns
+        -------
+        dict
+            Parsed tags by name
+        """
+        pointer = self.skip_prefix()
+        n_tags, _ = self._PREFIX_STRUCT.unpack_from(self.raw, pointer)
+        pointer += self._PREFIX_STRUCT.size
         result = {}
         for i_tag in range(n_tags):
-            tag = self.parse_tag(unpacker, i_tag)
-            name = tag.pop("name")
+            name, tag, pointer = self.parse_tag(pointer, i_tag)
             result[name] = tag
         return result
 
@@ -223,13 +511,13 @@ class CsaHeader:
         int
             CSA header type (1 or 2)
         """
-        is_type_2 = self.raw[:4] == self.TYPE_2_IDENTIFIER
+        is_type_2 = self.raw.startswith(self.TYPE_2_IDENTIFIER)
         return self.CSA_TYPE_2 if is_type_2 else self.CSA_TYPE_1
 
     @property
     def csa_type(self) -> int:
         """
-        Checks whether the given CSA header is of type 1 or 2.
+        Returns the CSA header type, as determined on initialization.
 
         See Also
         --------
@@ -240,7 +528,7 @@ class CsaHeader:
         int
             CSA header type (1 or 2)
         """
-        return self.check_csa_type()
+        return self._csa_type
 
     @property
     def is_type_2(self) -> bool:
@@ -252,4 +540,4 @@ class CsaHeader:
         bool
             CSA type 2 or not
         """
-        return self.csa_type == self.CSA_TYPE_2
+        return self._is_type_2
@@ -1,6 +1,15 @@
 """
 Utilities for the :mod:`csa_header` library.
 """
+from __future__ import annotations
+
+import pickle
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from threading import Lock
+from typing import Any
+
 # DICOM VR code to Python type
 VR_TO_TYPE = {
     "FL": float,  # float
@@ -17,20 +26,129 @@ ENCODING: str = "latin-1"
 NULL: bytes = b"\x00"
 
 
-def strip_to_null(string):
+def strip_to_null(string: bytes) -> str:
     """
-    Strip string to first null.
+    Strip string to first null and decode it.
 
     Parameters
     ----------
-    s : bytes
+    string : bytes
+        Null-terminated (or unterminated) byte string
 
     Returns
     -------
-    sdash : str
-       s stripped to first occurrence of null (0)
+    str
+       Decoded `string`, stripped to the first occurrence of null (0)
+    """
+    return string.partition(NULL)[0].decode(ENCODING)
+
+
+@lru_cache(maxsize=128)
+def decode_vr(raw_vr: bytes) -> str:
     """
-    zero_position = string.find(NULL)
-    if zero_position == -1:
-        return string
-    return string[:zero_position].decode(ENCODING)
+    Decode a raw, null-padded value representation.
+
+    Only a handful of distinct VRs exist, so results are cached and the same
+    (hash-cached) string object is returned for every occurrence.
+
+    Parameters
+    ----------
+    raw_vr : bytes
+        Raw VR as stored in the tag's header
+
+    Returns
+    -------
+    str
+        Value representation
+    """
+    return strip_to_null(raw_vr)
+
+
+class ParseCache:
+    """
+    Bounded, least-recently-used cache of parsed header values, keyed by a
+    digest of the raw header. Values are stored pickled, so every hit returns
+    an independent copy that may safely be modified by the caller.
+    """
+
+    #: Size (in bytes) of the digest used as cache key.
+    DIGEST_SIZE: int = 16
+
+    def __init__(self, max_size: int = 32):
+        """
+        Initialize a new `ParseCache` instance.
+
+        Parameters
+        ----------
+        max_size : int, optional
+            Maximal number of cached values, by default 32
+        """
+        self.max_size = max_size
+        self._cache: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    def get_key(self, raw: bytes | bytearray, person: bytes = b"") -> bytes:
+        """
+        Returns the cache key of a raw header.
+
+        Parameters
+        ----------
+        raw : bytes | bytearray
+            Raw header
+        person : bytes, optional
+            Digest personalization (up to 16 bytes), by default empty. Keys
+            computed with different personalizations never collide, e.g. when
+            *raw* may be encoded in different ways
+
+        Returns
+        -------
+        bytes
+            Cache key
+        """
+        return blake2b(raw, digest_size=self.DIGEST_SIZE, person=person).digest()
+
+    def get(self, key: bytes) -> Any:
+        """
+        Returns a copy of the cached value, or None if missing.
+
+        Parameters
+        ----------
+        key : bytes
+            Cache key
+
+        Returns
+        -------
+        Any
+            Cached value
+        """
+        with self._lock:
+            pickled = self._cache.get(key)
+            if pickled is None:
+                return None
+            self._cache.move_to_end(key)
+        return pickle.loads(pickled)  # noqa: S301
+
+    def put(self, key: bytes, value: Any):
+        """
+        Caches a value, evicting the least recently used one if full.
+
+        Parameters
+        ----------
+        key : bytes
+            Cache key
+        value : Any
+            Value to cache
+        """
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._cache[key] = pickled
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached values.
+        """
+        with self._lock:
+            self._cache.clear()
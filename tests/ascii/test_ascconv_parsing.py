@@ -1,6 +1,7 @@
 from unittest import TestCase
+from unittest.mock import patch
 
-from csa_header.ascii.ascconv import parse_ascconv, parse_ascconv_text
+from csa_header.ascii.ascconv import AscconvParseError, parse_ascconv, parse_ascconv_text
 from tests.ascii.fixtures import PARSED_ELEMENTS, RAW_ELEMENTS
 from tests.fixtures import RSFMRI_CSA_SERIES_HEADER_INFO
 
@@ -28,3 +29,21 @@ class CsaParsingTestCase(TestCase):
     def test_parse_fragment(self):
         out = parse_ascconv_text(RAW_ELEMENTS)
         self.assertEqual(out, PARSED_ELEMENTS)
+
+    def test_parse_fragment_with_ast_parser(self):
+        with patch("csa_header.ascii.ascconv._parse_simple_ascconv_text", return_value=None):
+            out = parse_ascconv_text(RAW_ELEMENTS)
+        self.assertEqual(out, PARSED_ELEMENTS)
+
+    def test_parse_matches_ast_parser(self):
+        with patch("csa_header.ascii.ascconv._parse_simple_ascconv_text", return_value=None):
+            csa_data, _ = parse_ascconv(self.series_header_info.decode("ISO-8859-1"), delimiter='""')
+        self.assertEqual(csa_data, self.csa_data)
+
+    def test_parse_fragment_with_non_simple_line(self):
+        out = parse_ascconv_text(RAW_ELEMENTS + "a = 1; b = 2\n")
+        self.assertEqual(out, {**PARSED_ELEMENTS, "a": 1, "b": 2})
+
+    def test_parse_invalid_assignment_raises(self):
+        with self.assertRaises(AscconvParseError):
+            parse_ascconv_text("a = 1\na.b = 2")
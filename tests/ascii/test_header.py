@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from pathlib import Path
 from unittest import TestCase
 
@@ -9,15 +10,40 @@ class CsaAsciiHeaderTestCase(TestCase):
     slice_array_size = 64
     CSA_FILE: Path = RSFMRI_CSA_SERIES_HEADER_INFO
 
+    @classmethod
+    def setUpClass(cls):
+        with open(cls.CSA_FILE, "rb") as f:
+            cls.series_header_info = f.read()
+
     def setUp(self):
-        with open(self.CSA_FILE, "rb") as f:
-            self.series_header_info = f.read()
         self.ascii_header = CsaAsciiHeader(self.series_header_info)
 
     def test_init_prepares_cached_variables(self):
         fresh_header = CsaAsciiHeader(self.series_header_info)
         self.assertEqual(fresh_header._parsed, {})
 
+    def test_init_with_str(self):
+        header = CsaAsciiHeader(self.series_header_info.decode(CsaAsciiHeader.ENCODING))
+        self.assertEqual(header.parsed, self.ascii_header.parsed)
+
+    def test_init_with_non_latin_1_str(self):
+        text = self.series_header_info.decode(CsaAsciiHeader.ENCODING)
+        text = text.replace('tSequenceFileName\t = \t""', 'tSequenceFileName\t = \t""\u20ac', 1)
+        parsed = CsaAsciiHeader(text).parsed
+        self.assertTrue(parsed["tSequenceFileName"].startswith("\u20ac"))
+        self.assertNotEqual(parsed, self.ascii_header.parsed)
+
+    def test_mapping_interface(self):
+        self.assertIsInstance(self.ascii_header, Mapping)
+        self.assertEqual(dict(self.ascii_header), self.ascii_header.parsed)
+        self.assertEqual(self.ascii_header["sSliceArray"]["lSize"], self.slice_array_size)
+
+    def test_parsing_is_deferred_until_accessed(self):
+        fresh_header = CsaAsciiHeader(self.series_header_info)
+        self.assertEqual(fresh_header._parsed, {})
+        self.assertIn("sSliceArray", fresh_header)
+        self.assertNotEqual(fresh_header._parsed, {})
+
     def test_parse_returns_dict(self):
         parsed = self.ascii_header.parse()
         self.assertIsInstance(parsed, dict)
@@ -36,6 +62,12 @@ class CsaAsciiHeaderTestCase(TestCase):
         self.assertIsInstance(value, list)
         self.assertEqual(len(value), 2)
 
+    def test_parse_returns_independent_copies(self):
+        parsed = self.ascii_header.parse()
+        reparsed = CsaAsciiHeader(self.series_header_info).parse()
+        self.assertEqual(parsed, reparsed)
+        self.assertIsNot(parsed, reparsed)
+
     def test_parsed_property(self):
         self.assertIsInstance(self.ascii_header.parsed, dict)
         self.assertIs(self.ascii_header.parsed, self.ascii_header.parsed)
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from csa_header.batch import read_many
+from csa_header.header import CsaHeader
+from tests.fixtures import DWI_CSA_IMAGE_HEADER_INFO, RSFMRI_CSA_SERIES_HEADER_INFO
+
+
+class ReadManyTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.raws = []
+        for path in (DWI_CSA_IMAGE_HEADER_INFO, RSFMRI_CSA_SERIES_HEADER_INFO):
+            with open(path, "rb") as f:
+                cls.raws.append(f.read())
+
+    def test_read_many(self):
+        results = read_many(self.raws, max_workers=2)
+        expected = [CsaHeader(raw).read() for raw in self.raws]
+        self.assertEqual(results, expected)
+
+    def test_read_many_returns_parsed_ascii_headers(self):
+        results = read_many(self.raws, max_workers=2)
+        protocol = results[1]["MrPhoenixProtocol"]["value"]
+        self.assertIsInstance(protocol, dict)
+        self.assertEqual(protocol["sSliceArray"]["lSize"], 64)
+
+    def test_read_many_with_single_worker(self):
+        results = read_many(self.raws, max_workers=1)
+        self.assertEqual(len(results), len(self.raws))
+
+    def test_read_many_empty(self):
+        self.assertEqual(read_many([]), [])
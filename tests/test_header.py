@@ -1,7 +1,11 @@
+import json
+from struct import pack
 from unittest import TestCase
 
+from csa_header.ascii import CsaAsciiHeader
+from csa_header.exceptions import CsaReadError
 from csa_header.header import CsaHeader
-from tests.fixtures import DWI_CSA_IMAGE_HEADER_INFO
+from tests.fixtures import DWI_CSA_IMAGE_HEADER_INFO, RSFMRI_CSA_SERIES_HEADER_INFO
 
 TEST_DWI_HEADER_SIZE: int = 12964
 
@@ -16,6 +20,10 @@ class CsaHeaderTestCase(TestCase):
     def test_init_stores_raw(self):
         self.assertEqual(self.csa.raw, self.raw_csa)
 
+    def test_init_with_buffer(self):
+        for raw in (bytearray(self.raw_csa), memoryview(self.raw_csa)):
+            self.assertEqual(CsaHeader(raw).read(), self.csa.read())
+
     def test_header_size(self):
         self.assertEqual(self.csa.header_size, TEST_DWI_HEADER_SIZE)
 
@@ -23,3 +31,77 @@ class CsaHeaderTestCase(TestCase):
         value = self.csa.check_csa_type()
         expected = CsaHeader.CSA_TYPE_2
         self.assertEqual(value, expected)
+
+    def test_skip_empty_items(self):
+        raw = CsaHeader.TYPE_2_IDENTIFIER + pack("<8i", 0, 0, 77, 0, 0, 0, 205, 0)
+        pointer = CsaHeader(raw).skip_empty_items(4, 2)
+        self.assertEqual(pointer, len(raw))
+
+    def test_skip_empty_items_with_non_empty_item_raises(self):
+        raw = CsaHeader.TYPE_2_IDENTIFIER + pack("<8i", 0, 0, 77, 0, 4, 4, 77, 0) + b"1234"
+        with self.assertRaises(CsaReadError):
+            CsaHeader(raw).skip_empty_items(4, 2)
+
+    def test_read_with_negative_item_count(self):
+        raw = CsaHeader.TYPE_2_IDENTIFIER + pack("<4x2I", 1, 77) + pack("<64si4s3i", b"Tag", 1, b"IS", 0, -1, 77)
+        parsed = CsaHeader(raw).read()
+        self.assertIsNone(parsed["Tag"]["value"])
+
+
+class CsaSeriesHeaderTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(RSFMRI_CSA_SERIES_HEADER_INFO, "rb") as f:
+            cls.raw_csa = f.read()
+        cls.parsed = CsaHeader(cls.raw_csa).read()
+
+    def test_ascii_header_is_parsed(self):
+        value = self.parsed["MrPhoenixProtocol"]["value"]
+        self.assertIsInstance(value, dict)
+        self.assertEqual(value["sSliceArray"]["lSize"], 64)
+        json.dumps(self.parsed)
+
+    def test_ascii_header_is_parsed_lazily(self):
+        parsed = CsaHeader(self.raw_csa, lazy_ascii=True).read()
+        value = parsed["MrPhoenixProtocol"]["value"]
+        self.assertIsInstance(value, CsaAsciiHeader)
+        self.assertEqual(value, self.parsed["MrPhoenixProtocol"]["value"])
+
+    def test_ascii_header_is_not_decoded_by_read(self):
+        parsed = CsaHeader(self.raw_csa, lazy_ascii=True).read()
+        self.assertIsInstance(parsed["MrPhoenixProtocol"]["value"]._header, bytes)
+
+    def test_read_with_cache(self):
+        csa = CsaHeader(self.raw_csa, enable_cache=True)
+        first, second = csa.read(), csa.read()
+        self.assertEqual(first, second)
+        self.assertEqual(first, CsaHeader(self.raw_csa).read())
+
+    def test_read_with_cache_returns_independent_copies(self):
+        csa = CsaHeader(self.raw_csa, enable_cache=True)
+        first = csa.read()
+        first["MrPhoenixProtocol"]["value"] = None
+        self.assertIsInstance(csa.read()["MrPhoenixProtocol"]["value"], dict)
+
+    def test_read_with_cache_keeps_lazy_results_apart(self):
+        lazy = CsaHeader(self.raw_csa, enable_cache=True, lazy_ascii=True).read()
+        eager = CsaHeader(self.raw_csa, enable_cache=True).read()
+        self.assertIsInstance(lazy["MrPhoenixProtocol"]["value"], CsaAsciiHeader)
+        self.assertIsInstance(eager["MrPhoenixProtocol"]["value"], dict)
+
+
+class CsaType1HeaderTestCase(TestCase):
+    @staticmethod
+    def pack_tag(name: bytes, vm: int, vr: bytes, items: list, first_tag_n_items: int) -> bytes:
+        packed = pack("<64si4s3i", name, vm, vr, 0, len(items), 77)
+        for item in items:
+            packed += pack("<4i", len(item) + first_tag_n_items, len(item), 77, 0)
+            packed += item + b"\x00" * (-len(item) & 3)
+        return packed
+
+    def test_read_skips_empty_surplus_items(self):
+        raw = pack("<2I", 2, 77)
+        raw += self.pack_tag(b"First", 1, b"IS", [], 3)
+        raw += self.pack_tag(b"Second", 1, b"DS", [b"1.5\x00", b"", b""], 3)
+        parsed = CsaHeader(raw).read()
+        self.assertEqual(parsed["Second"]["value"], 1.5)
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from csa_header.utils import ParseCache, decode_vr, strip_to_null
+
+
+class StripToNullTestCase(TestCase):
+    def test_strips_to_first_null(self):
+        self.assertEqual(strip_to_null(b"IS\x00\x00"), "IS")
+
+    def test_decodes_unterminated_string(self):
+        self.assertEqual(strip_to_null(b"value"), "value")
+
+
+class DecodeVrTestCase(TestCase):
+    def test_decode_vr(self):
+        self.assertEqual(decode_vr(b"DS\x00\x00"), "DS")
+
+    def test_decode_vr_returns_cached_string(self):
+        # Equal, but distinct raw VR objects.
+        raw_vr = b"IS\x00\x00"
+        other_raw_vr = bytes(bytearray(raw_vr))
+        self.assertIsNot(raw_vr, other_raw_vr)
+        self.assertIs(decode_vr(raw_vr), decode_vr(other_raw_vr))
+
+
+class ParseCacheTestCase(TestCase):
+    def setUp(self):
+        self.cache = ParseCache(max_size=2)
+
+    def test_get_missing_returns_none(self):
+        key = self.cache.get_key(b"raw")
+        self.assertIsNone(self.cache.get(key))
+
+    def test_get_returns_independent_copy(self):
+        key = self.cache.get_key(b"raw")
+        value = {"a": [1, 2]}
+        self.cache.put(key, value)
+        cached = self.cache.get(key)
+        self.assertEqual(cached, value)
+        self.assertIsNot(cached, value)
+        cached["a"].append(3)
+        self.assertEqual(self.cache.get(key), value)
+
+    def test_get_key_with_person(self):
+        self.assertNotEqual(self.cache.get_key(b"raw"), self.cache.get_key(b"raw", person=b"text"))
+
+    def test_evicts_least_recently_used(self):
+        keys = [self.cache.get_key(raw) for raw in (b"a", b"b", b"c")]
+        self.cache.put(keys[0], 0)
+        self.cache.put(keys[1], 1)
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], 2)
+        self.assertEqual(self.cache.get(keys[0]), 0)
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertEqual(self.cache.get(keys[2]), 2)